@@ -0,0 +1,76 @@
+"""Tests for worktree_mux.dashboard — screen updates and current-worktree detection."""
+
+from pathlib import Path
+
+import pytest
+
+from worktree_mux.dashboard import CLEAR_SCREEN, _frame_update, _get_current_worktree
+from worktree_mux.git import WorktreeInfo
+
+
+class TestFrameUpdate:
+    def test_first_frame_clears_and_draws_everything(self) -> None:
+        assert _frame_update(None, ["a", "b"], 80, 24) == CLEAR_SCREEN + "a\nb\n"
+
+    def test_unchanged_frame_only_parks_cursor(self) -> None:
+        assert _frame_update(["a", "b"], ["a", "b"], 80, 24) == "\033[3;1H"
+
+    def test_rewrites_only_changed_lines(self) -> None:
+        out = _frame_update(["a", "b", "c"], ["a", "B", "c"], 80, 24)
+        assert out == "\033[2;1HB\033[K\033[4;1H"
+
+    def test_shorter_frame_erases_leftovers(self) -> None:
+        out = _frame_update(["a", "b", "c"], ["a"], 80, 24)
+        assert out == "\033[2;1H\033[J\033[2;1H"
+
+    def test_wrapping_line_forces_full_redraw(self) -> None:
+        out = _frame_update(["a"], ["x" * 10], 10, 24)
+        assert out.startswith(CLEAR_SCREEN)
+
+    def test_frame_taller_than_terminal_forces_full_redraw(self) -> None:
+        lines = [str(i) for i in range(40)]
+        out = _frame_update(lines, lines[:-1] + ["x"], 80, 24)
+        assert out.startswith(CLEAR_SCREEN)
+
+    def test_shrinking_from_taller_than_terminal_forces_full_redraw(self) -> None:
+        lines = [f"row{i}" for i in range(40)]
+        assert _frame_update(lines, lines[:20], 80, 24).startswith(CLEAR_SCREEN)
+
+    def test_previous_wrapped_line_forces_full_redraw(self) -> None:
+        out = _frame_update(["x" * 100, "a", "b"], ["y", "a", "b"], 80, 24)
+        assert out.startswith(CLEAR_SCREEN)
+
+    def test_ansi_styles_do_not_count_toward_width(self) -> None:
+        styled = "\033[1m" + "x" * 5 + "\033[0m"
+        assert not _frame_update([""], [styled], 10, 24).startswith(CLEAR_SCREEN)
+
+
+class TestGetCurrentWorktree:
+    @pytest.fixture()
+    def worktrees(self, tmp_path: Path) -> list[WorktreeInfo]:
+        paths = [tmp_path / ".worktrees" / "feature" / "auth", tmp_path / ".worktrees" / "feat"]
+        for path in paths:
+            (path / "src").mkdir(parents=True)
+        return [WorktreeInfo(path=p, branch=p.name, commit="abc123") for p in paths]
+
+    def test_subdirectory_of_worktree(
+        self, worktrees: list[WorktreeInfo], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(worktrees[0].path / "src")
+        assert _get_current_worktree(worktrees) == worktrees[0]
+
+    def test_sibling_with_common_prefix_is_not_matched(
+        self, worktrees: list[WorktreeInfo], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / ".worktrees" / "feature-x").mkdir()
+        monkeypatch.chdir(tmp_path / ".worktrees" / "feature-x")
+        assert _get_current_worktree(worktrees) is None
+
+    def test_symlinked_worktree_path_falls_back_to_resolve(
+        self, worktrees: list[WorktreeInfo], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        link = tmp_path / "link"
+        link.symlink_to(worktrees[1].path)
+        linked = WorktreeInfo(path=link, branch="feat", commit="abc123")
+        monkeypatch.chdir(worktrees[1].path / "src")
+        assert _get_current_worktree([linked]) == linked
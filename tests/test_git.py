@@ -7,9 +7,17 @@ import pytest
 from worktree_mux.git import (
     AmbiguousWorktreeError,
     Divergence,
+    WorktreeIndex,
     WorktreeInfo,
     WorktreeNotFoundError,
+    _list_worktrees_from_admin,
+    _worktrees_fingerprint,
+    build_worktree_index,
     check_leaf_collision,
+    format_relative_time,
+    parse_ahead_behind,
+    parse_committer_time,
+    parse_status_v2,
     resolve_worktree,
 )
 
@@ -68,6 +76,17 @@ class TestWorktreeInfo:
         wt = _wt("/repo/.worktrees/refactor-models")
         assert wt.leaf == "refactor-models"
 
+    def test_precomputed_name_and_leaf_are_kept(self) -> None:
+        wt = WorktreeInfo(
+            path=Path("/home/.worktrees/repo/.worktrees/feature/auth"),
+            branch="feature/auth",
+            commit="abc123",
+            name="feature/auth",
+            leaf="auth",
+        )
+        assert wt.name == "feature/auth"
+        assert wt.leaf == "auth"
+
 
 # ---------------------------------------------------------------------------
 # Name resolution
@@ -105,11 +124,23 @@ class TestResolveWorktree:
         assert result.name == "fix/parser-bug"
 
     def test_ambiguous_substring_raises(self, worktrees: list[WorktreeInfo]) -> None:
-        """'re' matches both 'feature/auth' and 'refactor-models'."""
+        """'fix' matches both 'fix/parser-bug' and 'fix/flaky-test'."""
+        worktrees = [*worktrees, _wt("/repo/.worktrees/fix/flaky-test", "fix/flaky-test")]
         with pytest.raises(AmbiguousWorktreeError) as exc_info:
-            resolve_worktree("re", worktrees)
+            resolve_worktree("fix", worktrees)
         assert len(exc_info.value.matches) >= 2
 
+    def test_short_query_skips_substring_match(self, worktrees: list[WorktreeInfo]) -> None:
+        """'re' is a substring of two worktrees but too short to try."""
+        with pytest.raises(WorktreeNotFoundError) as exc_info:
+            resolve_worktree("re", worktrees)
+        assert exc_info.value.query == "re"
+
+    def test_short_query_still_matches_leaf(self) -> None:
+        """The length limit only applies to the substring stage."""
+        worktrees = [_wt("/repo/.worktrees/feature/ui", "feature/ui")]
+        assert resolve_worktree("ui", worktrees).name == "feature/ui"
+
     def test_no_match_raises(self, worktrees: list[WorktreeInfo]) -> None:
         with pytest.raises(WorktreeNotFoundError) as exc_info:
             resolve_worktree("nonexistent", worktrees)
@@ -136,6 +167,121 @@ class TestResolveWorktree:
         assert result.name == "feature/auth"
 
 
+# ---------------------------------------------------------------------------
+# Worktree index
+# ---------------------------------------------------------------------------
+
+
+class TestWorktreeIndex:
+    @pytest.fixture()
+    def index(self) -> WorktreeIndex:
+        return build_worktree_index(
+            [
+                _wt("/repo/.worktrees/feature/auth"),
+                _wt("/repo/.worktrees/fix/parser-bug"),
+                _wt("/repo/.worktrees/fix/auth-refresh"),
+            ]
+        )
+
+    def test_by_name(self, index: WorktreeIndex) -> None:
+        wt = index.by_name("fix/parser-bug")
+        assert wt is not None and wt.leaf == "parser-bug"
+        assert index.by_name("fix") is None
+
+    def test_by_leaf(self, index: WorktreeIndex) -> None:
+        assert [wt.name for wt in index.by_leaf("auth")] == ["feature/auth"]
+        assert index.by_leaf("au") == []
+
+    def test_leaf_prefix_keeps_list_order(self, index: WorktreeIndex) -> None:
+        matches = index.leaf_prefix("auth")
+        assert [wt.name for wt in matches] == ["feature/auth", "fix/auth-refresh"]
+
+    def test_leaf_prefix_no_match(self, index: WorktreeIndex) -> None:
+        assert index.leaf_prefix("zzz") == []
+
+    def test_leaf_substring(self, index: WorktreeIndex) -> None:
+        matches = index.leaf_substring("re")
+        assert [wt.name for wt in matches] == ["fix/auth-refresh"]
+
+    def test_name_substring_reports_each_worktree_once(self, index: WorktreeIndex) -> None:
+        matches = index.name_substring("r")
+        assert [wt.name for wt in matches] == [
+            "feature/auth",
+            "fix/parser-bug",
+            "fix/auth-refresh",
+        ]
+
+    def test_empty_query_matches_everything(self, index: WorktreeIndex) -> None:
+        assert len(index.leaf_substring("")) == 3
+
+    def test_empty_index_matches_nothing(self) -> None:
+        index = build_worktree_index([])
+        assert index.leaf_substring("") == []
+        assert index.name_substring("") == []
+
+
+# ---------------------------------------------------------------------------
+# Reading .git/worktrees
+# ---------------------------------------------------------------------------
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _add_admin_entry(repo: Path, name: str, gitdir: str, head: str) -> None:
+    """Write the ``.git/worktrees/<name>`` files git keeps for a worktree."""
+    admin = repo / ".git" / "worktrees" / name
+    admin.mkdir(parents=True)
+    (admin / "gitdir").write_text(gitdir + "\n")
+    (admin / "HEAD").write_text(head + "\n")
+
+
+class TestListWorktreesFromAdmin:
+    @pytest.fixture()
+    def repo(self, tmp_path: Path) -> Path:
+        repo = tmp_path.resolve() / "repo"
+        (repo / ".git" / "refs" / "heads" / "feature").mkdir(parents=True)
+        return repo
+
+    def test_branch_from_loose_ref(self, repo: Path) -> None:
+        (repo / ".git" / "refs" / "heads" / "feature" / "auth").write_text(SHA_A + "\n")
+        wt = repo / ".worktrees" / "feature" / "auth"
+        _add_admin_entry(repo, "auth", f"{wt}/.git", "ref: refs/heads/feature/auth")
+        assert _list_worktrees_from_admin(repo) == [
+            WorktreeInfo(path=wt, branch="feature/auth", commit=SHA_A)
+        ]
+
+    def test_branch_from_packed_refs(self, repo: Path) -> None:
+        (repo / ".git" / "packed-refs").write_text(
+            f"# pack-refs with: peeled fully-peeled sorted\n{SHA_B} refs/heads/packed\n"
+        )
+        wt = repo / ".worktrees" / "packed"
+        _add_admin_entry(repo, "packed", f"{wt}/.git", "ref: refs/heads/packed")
+        assert _list_worktrees_from_admin(repo) == [
+            WorktreeInfo(path=wt, branch="packed", commit=SHA_B)
+        ]
+
+    def test_detached_head(self, repo: Path) -> None:
+        wt = repo / ".worktrees" / "detached"
+        _add_admin_entry(repo, "detached", f"{wt}/.git", SHA_A)
+        assert _list_worktrees_from_admin(repo) == [WorktreeInfo(path=wt, branch="", commit=SHA_A)]
+
+    def test_relative_gitdir(self, repo: Path) -> None:
+        wt = repo / ".worktrees" / "rel"
+        wt.mkdir(parents=True)
+        _add_admin_entry(repo, "rel", "../../../.worktrees/rel/.git", SHA_A)
+        assert [w.path for w in _list_worktrees_from_admin(repo) or []] == [wt]
+
+    def test_worktree_outside_worktrees_dir_is_skipped(self, repo: Path, tmp_path: Path) -> None:
+        _add_admin_entry(repo, "elsewhere", f"{tmp_path.resolve()}/elsewhere/.git", SHA_A)
+        assert _list_worktrees_from_admin(repo) == []
+
+    def test_reftable_falls_back_to_git(self, repo: Path) -> None:
+        (repo / ".git" / "reftable").mkdir()
+        assert _list_worktrees_from_admin(repo) is None
+        assert _worktrees_fingerprint(repo) is None
+
+
 # ---------------------------------------------------------------------------
 # Leaf collision detection
 # ---------------------------------------------------------------------------
@@ -157,3 +303,117 @@ class TestCheckLeafCollision:
         ]
         result = check_leaf_collision(worktrees[0], worktrees)
         assert len(result) == 2
+
+    def test_collision_detected_with_index(self) -> None:
+        worktrees = [
+            _wt("/repo/.worktrees/feature/auth"),
+            _wt("/repo/.worktrees/fix/auth"),
+            _wt("/repo/.worktrees/fix/parser"),
+        ]
+        index = build_worktree_index(worktrees)
+        result = check_leaf_collision(worktrees[0], worktrees, index)
+        assert [wt.name for wt in result] == ["feature/auth", "fix/auth"]
+
+
+# ---------------------------------------------------------------------------
+# git status parsing
+# ---------------------------------------------------------------------------
+
+
+class TestParseStatusV2:
+    def test_counts_entries_and_reads_head(self) -> None:
+        output = (
+            b"# branch.oid 1234abcd\0"
+            b"# branch.head feature/auth\0"
+            b"1 .M N... 100644 100644 100644 aaa bbb src/app.py\0"
+            b"2 R. N... 100644 100644 100644 aaa bbb R100 new.py\0old.py\0"
+            b"? notes.txt\0"
+        )
+        stats = parse_status_v2(output)
+        assert stats.modified == 3
+        assert stats.head == "1234abcd"
+
+    def test_rename_source_path_is_not_counted(self) -> None:
+        output = (
+            b"# branch.oid 1234abcd\0"
+            b"2 R. N... 100644 100644 100644 aaa bbb R100 a.py\0# odd name.py\0"
+        )
+        assert parse_status_v2(output).modified == 1
+
+    def test_clean(self) -> None:
+        stats = parse_status_v2(b"# branch.oid 1234abcd\0# branch.head main\0")
+        assert stats.modified == 0
+
+    def test_unborn_branch_has_no_head(self) -> None:
+        stats = parse_status_v2(b"# branch.oid (initial)\0# branch.head main\0? a\0")
+        assert stats.head is None
+        assert stats.modified == 1
+
+
+class TestParseAheadBehind:
+    def test_parses_commit_and_counts_per_branch(self) -> None:
+        output = "refs/heads/feature/auth\taaa\t1 3\nrefs/heads/fix/parser-bug\tbbb\t0 4\n"
+        divs = parse_ahead_behind(output)
+        assert divs == {
+            "feature/auth": ("aaa", Divergence(ahead=1, behind=3)),
+            "fix/parser-bug": ("bbb", Divergence(ahead=0, behind=4)),
+        }
+
+    def test_skips_malformed_and_foreign_refs(self) -> None:
+        output = "refs/heads/a\taaa\t\nrefs/tags/v1\tccc\t1 0\nrefs/heads/b\tbbb\t2 0\n"
+        assert parse_ahead_behind(output) == {"b": ("bbb", Divergence(ahead=2, behind=0))}
+
+
+class TestParseCommitterTime:
+    def test_reads_committer_not_author(self) -> None:
+        contents = (
+            b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+            b"author A U Thor <a@example.com> 1600000000 +0100\n"
+            b"committer C O Mitter <c@example.com> 1700000000 -0500\n"
+            b"\n"
+            b"committer 1 in the message\n"
+        )
+        assert parse_committer_time(contents) == 1700000000
+
+    def test_missing_or_malformed_header(self) -> None:
+        assert parse_committer_time(b"tree abc\n\ncommitter x 1 +0000\n") is None
+        assert parse_committer_time(b"committer C <c@example.com> soon +0000\n") is None
+
+
+# ---------------------------------------------------------------------------
+# Relative time formatting
+# ---------------------------------------------------------------------------
+
+
+class TestFormatRelativeTime:
+    """Buckets must match ``git log --format=%cr``."""
+
+    NOW = 1_700_000_000
+
+    def _ago(self, seconds: int) -> str:
+        return format_relative_time(self.NOW - seconds, now=self.NOW)
+
+    def test_seconds(self) -> None:
+        assert self._ago(1) == "1 second ago"
+        assert self._ago(89) == "89 seconds ago"
+
+    def test_minutes(self) -> None:
+        assert self._ago(90) == "2 minutes ago"
+        assert self._ago(60 * 60) == "60 minutes ago"
+
+    def test_hours(self) -> None:
+        assert self._ago(2 * 3600) == "2 hours ago"
+
+    def test_days_and_weeks(self) -> None:
+        assert self._ago(3 * 86400) == "3 days ago"
+        assert self._ago(21 * 86400) == "3 weeks ago"
+
+    def test_months(self) -> None:
+        assert self._ago(100 * 86400) == "3 months ago"
+
+    def test_years_and_months(self) -> None:
+        assert self._ago(400 * 86400) == "1 year, 1 month ago"
+        assert self._ago(730 * 86400) == "2 years ago"
+
+    def test_future(self) -> None:
+        assert format_relative_time(self.NOW + 10, now=self.NOW) == "in the future"
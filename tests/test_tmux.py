@@ -0,0 +1,40 @@
+"""Tests for worktree_mux.tmux — batched window queries and commands."""
+
+from worktree_mux.tmux import _gone_windows, _kill_windows_args, _parse_panes
+
+
+class TestParsePanes:
+    def test_keeps_windows_of_the_session_once(self) -> None:
+        output = "repo\tmain\nrepo\tauth\nrepo\tauth\nother\tauth\nrepo-2\tparser\n"
+        assert _parse_panes(output, "repo") == {"main", "auth"}
+
+    def test_window_name_with_tab_and_malformed_lines(self) -> None:
+        assert _parse_panes("repo\ta\tb\ngarbage\n\n", "repo") == {"a\tb"}
+
+    def test_empty(self) -> None:
+        assert _parse_panes("", "repo") == set()
+
+
+class TestKillWindowsArgs:
+    def test_chains_kills_with_separator(self) -> None:
+        assert _kill_windows_args("repo", ["a", "b"]) == [
+            "kill-window",
+            "-t",
+            "repo:a",
+            ";",
+            "kill-window",
+            "-t",
+            "repo:b",
+        ]
+
+    def test_single_window_has_no_separator(self) -> None:
+        assert _kill_windows_args("repo", ["a"]) == ["kill-window", "-t", "repo:a"]
+
+
+class TestGoneWindows:
+    def test_reports_only_windows_no_longer_open(self) -> None:
+        # A failed chain can leave later windows alive; they must not be reported.
+        assert _gone_windows(["a", "b", "c"], ["main", "c"]) == ["a", "b"]
+
+    def test_nothing_gone(self) -> None:
+        assert _gone_windows(["a"], ["a"]) == []
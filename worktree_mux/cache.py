@@ -0,0 +1,65 @@
+"""On-disk caches for worktree-mux.
+
+Small JSON files that let short-lived CLI invocations skip repeated git
+subprocesses. Every entry is stored with a validation stamp and is only
+returned while the caller's current stamp still matches, so a stale or
+corrupt file costs nothing more than a cache miss.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir() -> Path:
+    """Directory for persistent caches (``$XDG_CACHE_HOME/worktree-mux``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "worktree-mux"
+
+
+def runtime_dir() -> Path:
+    """Directory for per-login-session caches (``$XDG_RUNTIME_DIR/worktree-mux``).
+
+    Falls back to ``cache_dir()`` where there is no runtime directory
+    (e.g., macOS).
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    return Path(base) / "worktree-mux" if base else cache_dir()
+
+
+def cache_key(path: Path) -> str:
+    """Short, filesystem-safe key identifying ``path``."""
+    return hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+
+
+def load_entry(cache_file: Path) -> tuple[Any, Any] | None:
+    """Return the ``(stamp, data)`` pair in ``cache_file`` without validating it.
+
+    Callers compare the stamp themselves, since it may depend on the data.
+    """
+    try:
+        with cache_file.open() as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    return entry.get("stamp"), entry.get("data")
+
+
+def store(cache_file: Path, stamp: list[Any], data: Any) -> None:
+    """Write ``data`` to ``cache_file`` under ``stamp``.
+
+    The file is replaced atomically. Failures are ignored — the cache is
+    an optimization, never a requirement.
+    """
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w") as f:
+            json.dump({"stamp": stamp, "data": data}, f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        tmp.unlink(missing_ok=True)
@@ -22,16 +22,18 @@ from worktree_mux.git import (
     GitError,
     WorktreeInfo,
     WorktreeNotFoundError,
+    build_worktree_index,
     check_leaf_collision,
     get_repo_root,
     list_worktrees,
+    list_worktrees_for_cwd,
     resolve_worktree,
 )
 from worktree_mux.tmux import (
     TmuxError,
     create_session,
     create_window,
-    kill_window,
+    kill_windows_batch,
     list_windows,
     require_tmux,
     session_exists,
@@ -62,20 +64,18 @@ MAIN_WINDOW = "main"
 
 
 def _sync_orphaned_windows(session_name: str, worktrees: list[WorktreeInfo]) -> None:
-    """Close tmux windows whose worktrees no longer exist."""
-    if not session_exists(session_name):
-        return
+    """Close tmux windows whose worktrees no longer exist.
 
-    open_windows = list_windows(session_name)
+    ``list_windows`` is empty for a missing session, so no ``has-session``
+    probe is needed first.
+    """
+    open_windows = set(list_windows(session_name))
     worktree_leaves = {wt.leaf for wt in worktrees}
     reserved = {MAIN_WINDOW, "dash"}
 
-    for window_name in open_windows:
-        if window_name in reserved:
-            continue
-        if window_name not in worktree_leaves:
-            click.echo(f"  Cleaned up orphaned window: {window_name}", err=True)
-            kill_window(session_name, window_name)
+    orphans = sorted(open_windows - worktree_leaves - reserved)
+    for window_name in kill_windows_batch(session_name, orphans):
+        click.echo(f"  Cleaned up orphaned window: {window_name}", err=True)
 
 
 def _ensure_session_with_main(session_name: str, repo_root: Path) -> None:
@@ -105,13 +105,18 @@ def _worktree_name_completion(
     param: click.Parameter,
     incomplete: str,
 ) -> list[str]:
-    """Provide tab completion for worktree names."""
+    """Provide tab completion for worktree names.
+
+    Leaves starting with ``incomplete`` win; if there are none, fall back
+    to leaves containing it anywhere.
+    """
     try:
-        repo_root = get_repo_root()
+        worktrees = list_worktrees_for_cwd()
     except GitError:
         return []
-    worktrees = list_worktrees(repo_root)
-    return [wt.leaf for wt in worktrees if incomplete in wt.leaf]
+    index = build_worktree_index(worktrees)
+    matches = index.leaf_prefix(incomplete) or index.leaf_substring(incomplete)
+    return [wt.leaf for wt in matches]
 
 
 # ---------------------------------------------------------------------------
@@ -181,7 +186,7 @@ def cd_cmd(name: str | None) -> None:
     If NAME is given, it is resolved using fuzzy matching:
       1. Exact path match (e.g., 'feature/auth')
       2. Leaf name match (e.g., 'auth')
-      3. Substring match (e.g., 'au')
+      3. Substring match, 3+ characters (e.g., 'pars')
 
     \b
     If NAME is omitted, switches to the 'main' window (repo root).
@@ -219,15 +224,16 @@ def cd_cmd(name: str | None) -> None:
         click.echo("No worktrees found under .worktrees/", err=True)
         sys.exit(1)
 
+    index = build_worktree_index(worktrees)
     try:
-        wt = resolve_worktree(name, worktrees)
+        wt = resolve_worktree(name, worktrees, index)
     except (AmbiguousWorktreeError, WorktreeNotFoundError) as e:
         _handle_resolve_error(e)
         return  # unreachable, but keeps mypy happy
 
     # Check for leaf name collision — worktree-mux uses leaf names for tmux windows,
     # so two worktrees with the same leaf would conflict.
-    collisions = check_leaf_collision(wt, worktrees)
+    collisions = check_leaf_collision(wt, worktrees, index)
     if len(collisions) > 1:
         click.echo(f"Error: Multiple worktrees share the leaf name '{wt.leaf}':", err=True)
         for c in collisions:
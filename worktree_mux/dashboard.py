@@ -1,38 +1,77 @@
 """Worktree dashboard rendering for worktree-mux.
 
 Provides both one-shot status (``print_status``) and a live-updating
-dashboard (``run_dashboard``).  Both share ``render_table`` so the
-output format stays consistent.
+dashboard (``run_dashboard``).  Both share ``render_lines`` so the
+output format stays consistent; the live dashboard only rewrites the
+lines that changed between refreshes.
 """
 
+import os
+import re
 import shutil
+import signal
 import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from types import FrameType
+from typing import TYPE_CHECKING
 
 import click
 
 from worktree_mux.git import (
+    MAX_PROBE_WORKERS,
+    GitBatch,
     WorktreeInfo,
+    format_relative_time,
+    get_all_divergences,
+    get_commit_time,
     get_default_branch,
     get_divergence,
-    get_last_commit_time,
-    get_last_commit_timestamp,
-    get_modified_count,
+    get_worktree_stats,
     list_worktrees,
 )
-from worktree_mux.tmux import list_windows
+from worktree_mux.tmux import batch_tmux_state
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
 REFRESH_INTERVAL_SECONDS = 5
 
+# Re-detect the default branch every N live refreshes (~5 minutes).
+DEFAULT_BRANCH_REFRESH_FRAMES = 60
+
+# Clear the terminal and move the cursor home.
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# Hide/show the cursor so it doesn't flash across rows during diff updates.
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+
+# ANSI SGR sequences for the table's fixed palette, built once instead of
+# per cell. All empty when NO_COLOR is set (https://no-color.org).
+_USE_COLOR = not os.environ.get("NO_COLOR")
+BOLD = "\033[1m" if _USE_COLOR else ""
+DIM = "\033[2m" if _USE_COLOR else ""
+CYAN_BOLD = "\033[1;36m" if _USE_COLOR else ""
+GREEN = "\033[32m" if _USE_COLOR else ""
+YELLOW = "\033[33m" if _USE_COLOR else ""
+RED = "\033[31m" if _USE_COLOR else ""
+RESET = "\033[0m" if _USE_COLOR else ""
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Terminal size while the live dashboard runs, refreshed by the SIGWINCH
+# handler so frames don't re-measure the terminal. None otherwise.
+_term_size: os.terminal_size | None = None
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RowData:
     """Pre-computed data for a single dashboard table row."""
 
@@ -46,38 +85,160 @@ class _RowData:
     is_current: bool
 
 
+# Commit id -> committer timestamp. Commits are immutable, so entries never
+# go stale; live refreshes only run ``git log`` for commits not seen before.
+_COMMIT_TIMES: dict[str, int] = {}
+
+# Worktree path -> resolved path. A worktree's location doesn't change while
+# it exists, so live refreshes resolve each one only once.
+_RESOLVED_PATHS: dict[Path, Path] = {}
+
+# Lazily created by _probe_pool().
+_PROBE_POOL: "ThreadPoolExecutor | None" = None
+
+
+def _resolved_path(path: Path) -> Path:
+    """``path.resolve()``, memoized in ``_RESOLVED_PATHS``."""
+    resolved = _RESOLVED_PATHS.get(path)
+    if resolved is None:
+        resolved = _RESOLVED_PATHS[path] = path.resolve()
+    return resolved
+
+
 def _get_current_worktree(worktrees: list[WorktreeInfo]) -> WorktreeInfo | None:
-    """Detect which worktree the user is currently in, if any."""
+    """Detect which worktree the user is currently in, if any.
+
+    Compares absolute paths as strings first, which needs no syscalls and
+    covers the usual layout. Only if that finds nothing are both sides
+    resolved, to handle symlinked checkouts.
+    """
     try:
-        cwd = Path.cwd().resolve()
+        cwd = Path.cwd()
+    except OSError:
+        return None
+    cwd_str = str(cwd)
+    for wt in worktrees:
+        wt_str = str(wt.path)
+        if cwd_str == wt_str or cwd_str.startswith(wt_str + os.sep):
+            return wt
+
+    try:
+        cwd = cwd.resolve()
     except OSError:
         return None
     for wt in worktrees:
         try:
-            cwd.relative_to(wt.path.resolve())
+            cwd.relative_to(_resolved_path(wt.path))
             return wt
         except ValueError:
             continue
     return None
 
 
+def _probe_pool() -> "ThreadPoolExecutor":
+    """Thread pool shared by every refresh of the dashboard.
+
+    Created on first use and kept for the life of the process, so live
+    refreshes reuse idle worker threads instead of starting new ones.
+    """
+    global _PROBE_POOL
+    if _PROBE_POOL is None:
+        # Deferred: only needed once there is something to probe.
+        from concurrent.futures import ThreadPoolExecutor
+
+        _PROBE_POOL = ThreadPoolExecutor(
+            max_workers=MAX_PROBE_WORKERS, thread_name_prefix="worktree-mux-probe"
+        )
+    return _PROBE_POOL
+
+
 def _build_rows(
     worktrees: list[WorktreeInfo],
     open_windows: set[str],
     default_branch: str,
     repo_root: Path,
     current_wt: WorktreeInfo | None,
+    batch: GitBatch | None = None,
 ) -> list[_RowData]:
-    """Build row data for all worktrees, sorted by last commit (most recent first)."""
+    """Build row data for all worktrees, sorted by last commit (most recent first).
+
+    Every refresh runs one ``git status`` per worktree (``get_worktree_stats``),
+    which yields both the modified-file count and the HEAD commit.
+    Commit-derived values are cached by commit id, so they never go stale:
+    last-commit times in ``_COMMIT_TIMES`` and divergences in git's
+    ``_DIV_CACHE``. The latter is keyed on the default branch tip too,
+    which is looked up over the ``GitBatch`` pipe when one is given (live
+    dashboard). New commits' times are read over that same pipe too; without
+    a batch they cost a ``git log`` each. The git calls are independent,
+    read-only subprocesses, so each batch runs concurrently on the shared
+    ``_probe_pool()``.
+    """
+    if not worktrees:
+        return []
+
+    # Without a batch (one-shot render) nothing would reuse the cache,
+    # so there is no tip to key divergences on and every probe runs.
+    default_tip = batch.resolve(f"refs/heads/{default_branch}") if batch is not None else None
+    pool = _probe_pool()
+    stats = list(pool.map(get_worktree_stats, [wt.path for wt in worktrees]))
+
+    # One for-each-ref covers every branch; only detached worktrees
+    # need their own rev-list.
+    all_div_future = pool.submit(
+        get_all_divergences,
+        repo_root,
+        [wt.branch for wt in worktrees if wt.branch],
+        default_branch,
+        commits={
+            wt.branch: st.head
+            for wt, st in zip(worktrees, stats, strict=True)
+            if wt.branch and st.head
+        },
+        default_commit=default_tip,
+    )
+    detached_div_futures = {
+        i: pool.submit(
+            get_divergence,
+            repo_root,
+            st.head or wt.commit,
+            default_branch,
+            branch_commit=st.head,
+            default_commit=default_tip,
+        )
+        for i, (wt, st) in enumerate(zip(worktrees, stats, strict=True))
+        if not wt.branch
+    }
+    timestamps = [_COMMIT_TIMES.get(st.head, 0) if st.head else 0 for st in stats]
+    if batch is not None:
+        for i, st in enumerate(stats):
+            if not timestamps[i] and st.head:
+                timestamps[i] = batch.commit_time(st.head) or 0
+                if timestamps[i]:
+                    _COMMIT_TIMES[st.head] = timestamps[i]
+    time_futures = {
+        i: pool.submit(get_commit_time, wt.path, stats[i].head)
+        for i, wt in enumerate(worktrees)
+        if not timestamps[i]
+    }
+
+    all_divs = all_div_future.result()
+    divergences = [
+        all_divs[wt.branch] if wt.branch else detached_div_futures[i].result()
+        for i, wt in enumerate(worktrees)
+    ]
+    for i, time_f in time_futures.items():
+        timestamps[i] = time_f.result()
+        head = stats[i].head
+        if head is not None and timestamps[i]:
+            _COMMIT_TIMES[head] = timestamps[i]
+
     rows: list[_RowData] = []
-    for wt in worktrees:
+    for i, (wt, st) in enumerate(zip(worktrees, stats, strict=True)):
         is_current = current_wt is not None and wt.path == current_wt.path
         tmux_marker = "●" if wt.leaf in open_windows else "○"
-        mod_count = get_modified_count(wt.path)
+        mod_count = st.modified
         mod_str = "clean" if mod_count == 0 else f"{mod_count} file{'s' if mod_count != 1 else ''}"
-        div = get_divergence(repo_root, wt.branch, default_branch)
-        last = get_last_commit_time(wt.path)
-        timestamp = get_last_commit_timestamp(wt.path)
+        last = format_relative_time(timestamps[i]) if timestamps[i] else "unknown"
         indicator = "▸" if is_current else " "
         rows.append(
             _RowData(
@@ -85,9 +246,9 @@ def _build_rows(
                 branch=wt.name,
                 tmux=tmux_marker,
                 modified=mod_str,
-                divergence=div.display(),
+                divergence=divergences[i].display(),
                 last_commit=last,
-                timestamp=timestamp,
+                timestamp=timestamps[i],
                 is_current=is_current,
             )
         )
@@ -98,42 +259,31 @@ def _build_rows(
 def _style_row(row: _RowData, widths: list[int]) -> str:
     """Format a data row with colors and proper column alignment."""
     # Indicator
-    if row.indicator == "▸":
-        indicator = click.style("▸", fg="cyan", bold=True)
-    else:
-        indicator = " "
+    indicator = f"{CYAN_BOLD}▸{RESET}" if row.indicator == "▸" else " "
 
     # Branch
-    padded_branch = f"{row.branch:<{widths[0]}}"
-    if row.is_current:
-        branch_styled = click.style(padded_branch, fg="cyan", bold=True)
-    else:
-        branch_styled = padded_branch
+    padded_branch = row.branch.ljust(widths[0])
+    branch_styled = f"{CYAN_BOLD}{padded_branch}{RESET}" if row.is_current else padded_branch
 
     # tmux status
-    padded_tmux = f"{row.tmux:^{widths[1]}}"
-    if row.tmux == "●":
-        tmux_styled = click.style(padded_tmux, fg="green")
-    else:
-        tmux_styled = click.style(padded_tmux, dim=True)
+    tmux_color = GREEN if row.tmux == "●" else DIM
+    tmux_styled = f"{tmux_color}{row.tmux.center(widths[1])}{RESET}"
 
     # Modified files
-    if row.modified == "clean":
-        mod_styled = click.style(f"{row.modified:<{widths[2]}}", fg="green")
-    else:
-        mod_styled = click.style(f"{row.modified:<{widths[2]}}", fg="yellow")
+    mod_color = GREEN if row.modified == "clean" else YELLOW
+    mod_styled = f"{mod_color}{row.modified.ljust(widths[2])}{RESET}"
 
     # Divergence — colour ↑ green, ↓ red
     if row.divergence == "even":
-        div_styled = click.style(f"{row.divergence:<{widths[3]}}", dim=True)
+        div_styled = f"{DIM}{row.divergence.ljust(widths[3])}{RESET}"
     else:
         parts = row.divergence.split()
         colored_parts: list[str] = []
         for p in parts:
             if p.startswith("↑"):
-                colored_parts.append(click.style(p, fg="green"))
+                colored_parts.append(f"{GREEN}{p}{RESET}")
             elif p.startswith("↓"):
-                colored_parts.append(click.style(p, fg="red"))
+                colored_parts.append(f"{RED}{p}{RESET}")
             else:
                 colored_parts.append(p)
         div_text = " ".join(colored_parts)
@@ -141,33 +291,108 @@ def _style_row(row: _RowData, widths: list[int]) -> str:
         div_styled = div_text + " " * max(0, padding)
 
     # Last commit
-    last_styled = click.style(f"{row.last_commit:<{widths[4]}}", dim=True)
+    last_styled = f"{DIM}{row.last_commit.ljust(widths[4])}{RESET}"
 
     return (
         f"  {indicator} {branch_styled}  {tmux_styled}  {mod_styled}  {div_styled}  {last_styled}"
     )
 
 
+def _visible_len(text: str) -> int:
+    """Length of ``text`` as displayed, ignoring ANSI escape sequences."""
+    return len(_ANSI_ESCAPE.sub("", text))
+
+
+def _on_resize(signum: int, frame: FrameType | None) -> None:
+    """SIGWINCH handler: re-measure the terminal size."""
+    global _term_size
+    _term_size = shutil.get_terminal_size()
+
+
+def _fits_screen(lines: list[str], columns: int, rows: int) -> bool:
+    """True if ``lines`` map one-to-one onto screen rows.
+
+    That needs no line to wrap and room for the frame plus the parked
+    cursor below it, since either would shift or scroll the rows.
+    """
+    return len(lines) + 1 <= rows and all(_visible_len(line) < columns for line in lines)
+
+
+def _frame_update(prev_lines: list[str] | None, lines: list[str], columns: int, rows: int) -> str:
+    """Terminal output that turns a screen showing ``prev_lines`` into ``lines``.
+
+    Only lines that differ from the previous frame are rewritten, using
+    cursor positioning. Falls back to clearing the screen and drawing
+    everything on the first frame (``prev_lines`` is None) or when either
+    frame doesn't fit the screen (see ``_fits_screen``): a previous frame
+    that wrapped or scrolled left the rows shifted, so it can't be diffed
+    against.
+    """
+    if (
+        prev_lines is None
+        or not _fits_screen(prev_lines, columns, rows)
+        or not _fits_screen(lines, columns, rows)
+    ):
+        return CLEAR_SCREEN + "".join(f"{line}\n" for line in lines)
+
+    parts: list[str] = []
+    for i, line in enumerate(lines):
+        if i >= len(prev_lines) or prev_lines[i] != line:
+            parts.append(f"\033[{i + 1};1H{line}\033[K")
+    if len(lines) < len(prev_lines):
+        # Erase leftovers from a taller previous frame.
+        parts.append(f"\033[{len(lines) + 1};1H\033[J")
+    # Park the cursor below the table, where a full redraw would leave it.
+    parts.append(f"\033[{len(lines) + 1};1H")
+    return "".join(parts)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def render_table(repo_root: Path, session_name: str, *, live: bool = False) -> None:
-    """Render the worktree dashboard table to stdout.
+def render_table(
+    repo_root: Path,
+    session_name: str,
+    *,
+    live: bool = False,
+    default_branch: str | None = None,
+) -> None:
+    """Render the worktree dashboard table to stdout (see ``render_lines``)."""
+    lines = render_lines(repo_root, session_name, live=live, default_branch=default_branch)
+    # One echo (and so one write) for the whole table.
+    click.echo("\n".join(lines))
+
+
+def render_lines(
+    repo_root: Path,
+    session_name: str,
+    *,
+    live: bool = False,
+    default_branch: str | None = None,
+    batch: GitBatch | None = None,
+) -> list[str]:
+    """Render the worktree dashboard table as a list of (styled) lines.
 
     Args:
         repo_root: Path to the git repository root.
         session_name: tmux session name (typically repo directory name).
         live: If True, shows refresh interval in header (for live dashboard).
+        default_branch: Branch to compute divergence against. Detected
+            from the repo when omitted.
+        batch: Open ``GitBatch`` for ref lookups; lets commit-derived
+            probes be reused across calls.
     """
+    lines: list[str] = []
     worktrees = list_worktrees(repo_root)
-    default_branch = get_default_branch(repo_root)
+    if default_branch is None:
+        default_branch = get_default_branch(repo_root)
     current_wt = _get_current_worktree(worktrees)
 
     # Header
     repo_name = repo_root.name
-    open_windows = set(list_windows(session_name))
+    open_windows = batch_tmux_state(session_name)
     worktree_count = len(worktrees)
     open_count = sum(1 for wt in worktrees if wt.leaf in open_windows)
     summary = f"{worktree_count} worktree{'s' if worktree_count != 1 else ''}, {open_count} open"
@@ -177,54 +402,54 @@ def render_table(repo_root: Path, session_name: str, *, live: bool = False) -> N
         )
     else:
         header = f"worktree-mux — {repo_name} ({summary})"
-    click.echo(click.style(header, bold=True))
+    lines.append(f"{BOLD}{header}{RESET}")
 
-    term_width = shutil.get_terminal_size().columns
-    click.echo(click.style("─" * min(len(header) + 2, term_width), dim=True))
-    click.echo()
+    term_width = (_term_size or shutil.get_terminal_size()).columns
+    lines.append(f"{DIM}{'─' * min(len(header) + 2, term_width)}{RESET}")
+    lines.append("")
 
     if not worktrees:
-        click.echo("  No worktrees found under .worktrees/")
-        click.echo()
-        click.echo("  Create one with: git worktree add .worktrees/<name> -b <branch>")
-        return
+        lines.append("  No worktrees found under .worktrees/")
+        lines.append("")
+        lines.append("  Create one with: git worktree add .worktrees/<name> -b <branch>")
+        return lines
 
-    rows = _build_rows(worktrees, open_windows, default_branch, repo_root, current_wt)
+    rows = _build_rows(worktrees, open_windows, default_branch, repo_root, current_wt, batch)
 
     # Column headers
     headers = ("Branch", "tmux", "Modified", f"vs {default_branch}", "Last Commit")
 
     # Compute column widths (max of header width and widest data value)
-    col_data: list[list[str]] = [
-        [r.branch for r in rows],
-        [r.tmux for r in rows],
-        [r.modified for r in rows],
-        [r.divergence for r in rows],
-        [r.last_commit for r in rows],
-    ]
-    widths = [max(len(headers[i]), *(len(v) for v in col_data[i])) for i in range(len(headers))]
+    widths = [len(h) for h in headers]
+    for r in rows:
+        widths[0] = max(widths[0], len(r.branch))
+        widths[1] = max(widths[1], len(r.tmux))
+        widths[2] = max(widths[2], len(r.modified))
+        widths[3] = max(widths[3], len(r.divergence))
+        widths[4] = max(widths[4], len(r.last_commit))
 
     # Header row
     hdr_parts = [
-        f"{headers[i]:^{widths[i]}}" if i == 1 else f"{headers[i]:<{widths[i]}}"
+        headers[i].center(widths[i]) if i == 1 else headers[i].ljust(widths[i])
         for i in range(len(headers))
     ]
     hdr_line = "    " + "  ".join(hdr_parts)
     sep_line = "    " + "  ".join("─" * w for w in widths)
 
-    click.echo(click.style(hdr_line, bold=True))
-    click.echo(click.style(sep_line, dim=True))
+    lines.append(f"{BOLD}{hdr_line}{RESET}")
+    lines.append(f"{DIM}{sep_line}{RESET}")
 
     for row in rows:
-        click.echo(_style_row(row, widths))
+        lines.append(_style_row(row, widths))
 
     # Legend
-    click.echo()
+    lines.append("")
     has_current = any(r.is_current for r in rows)
     legend = "  ● = tmux window open    ○ = no tmux window"
     if has_current:
         legend += "    ▸ = current"
-    click.echo(click.style(legend, dim=True))
+    lines.append(f"{DIM}{legend}{RESET}")
+    return lines
 
 
 def print_status(repo_root: Path, session_name: str) -> None:
@@ -233,13 +458,62 @@ def print_status(repo_root: Path, session_name: str) -> None:
 
 
 def run_dashboard(repo_root: Path, session_name: str) -> None:
-    """Run a live-updating dashboard until Ctrl+C."""
+    """Run a live-updating dashboard until Ctrl+C.
+
+    When stdout isn't a terminal (e.g., piped into a pager), there is no
+    screen to keep updated, so a single table is printed instead.
+    """
+    if not sys.stdout.isatty():
+        print_status(repo_root, session_name)
+        return
+
+    global _term_size
+    has_sigwinch = hasattr(signal, "SIGWINCH")
+    if has_sigwinch:
+        previous_handler = signal.signal(signal.SIGWINCH, _on_resize)
+    _term_size = shutil.get_terminal_size()
+
+    default_branch = get_default_branch(repo_root)
+    frame = 0
+    prev_lines: list[str] | None = None
+    prev_size: os.terminal_size | None = None
+    sys.stdout.write(HIDE_CURSOR)
     try:
-        while True:
-            sys.stdout.write("\033[2J\033[H")
-            sys.stdout.flush()
-            render_table(repo_root, session_name, live=True)
-            time.sleep(REFRESH_INTERVAL_SECONDS)
+        with GitBatch(repo_root) as batch:
+            while True:
+                # The default branch almost never changes, so only re-detect
+                # it occasionally instead of paying a git call every refresh.
+                if frame and frame % DEFAULT_BRANCH_REFRESH_FRAMES == 0:
+                    get_default_branch.cache_clear()
+                    default_branch = get_default_branch(repo_root)
+                frame += 1
+                lines = render_lines(
+                    repo_root,
+                    session_name,
+                    live=True,
+                    default_branch=default_branch,
+                    batch=batch,
+                )
+                if not has_sigwinch:
+                    _term_size = shutil.get_terminal_size()
+                # Checked after rendering so a resize that lands mid-frame
+                # turns this frame into a full redraw instead of a diff
+                # against a screen that has since reflowed.
+                size = _term_size
+                if size != prev_size:
+                    prev_lines = None
+                # An identical frame needs no terminal output at all.
+                if lines != prev_lines:
+                    sys.stdout.write(_frame_update(prev_lines, lines, size.columns, size.lines))
+                    sys.stdout.flush()
+                prev_lines, prev_size = lines, size
+                time.sleep(REFRESH_INTERVAL_SECONDS)
     except KeyboardInterrupt:
-        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+    finally:
+        sys.stdout.write(SHOW_CURSOR)
         sys.stdout.flush()
+        if has_sigwinch:
+            signal.signal(signal.SIGWINCH, previous_handler)
+        _term_size = None
@@ -1,16 +1,30 @@
 """Git operations and worktree discovery for worktree-mux."""
 
+import os
 import subprocess
+import time
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, Field, computed_field
+from worktree_mux import cache
+
+# Shortest query that resolve_worktree will try as a substring match.
+MIN_SUBSTRING_QUERY_LENGTH = 3
+
+# Upper bound on concurrent git subprocesses while probing worktrees.
+MAX_PROBE_WORKERS = 32
 
 
 class GitError(Exception):
     """Raised when a git operation fails."""
 
 
-class Divergence(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Divergence:
     """Commit divergence between a worktree branch and the default branch.
 
     Uses three-dot rev-list syntax which compares via the merge base,
@@ -23,10 +37,12 @@ class Divergence(BaseModel):
         even     — branch is at the same point as default
     """
 
-    model_config = {"extra": "forbid"}
+    ahead: int
+    behind: int
 
-    ahead: int = Field(ge=0)
-    behind: int = Field(ge=0)
+    def __post_init__(self) -> None:
+        if self.ahead < 0 or self.behind < 0:
+            raise ValueError(f"Negative divergence: ahead={self.ahead}, behind={self.behind}")
 
     def display(self) -> str:
         """Compact display string."""
@@ -40,31 +56,47 @@ class Divergence(BaseModel):
         return " ".join(parts)
 
 
-class WorktreeInfo(BaseModel):
-    """A git worktree located under .worktrees/."""
+@dataclass(frozen=True, slots=True)
+class WorktreeStats:
+    """Working-tree state of a worktree, gathered with a single git call."""
+
+    modified: int
+    head: str | None
 
-    model_config = {"extra": "forbid"}
+    def __post_init__(self) -> None:
+        if self.modified < 0:
+            raise ValueError(f"Negative modified count: {self.modified}")
+
+
+@dataclass(frozen=True, slots=True)
+class WorktreeInfo:
+    """A git worktree located under .worktrees/.
+
+    ``name`` and ``leaf`` are stored, not computed on access. Worktree
+    discovery passes them in (it already knows the path relative to
+    ``.worktrees/``); when omitted they are derived from ``path``.
+    """
 
     path: Path
     branch: str
     commit: str
+    # Relative path under .worktrees/ (e.g., 'feature/auth').
+    name: str = field(default="", compare=False)
+    # Last path component (e.g., 'auth' from '.worktrees/feature/auth').
+    leaf: str = field(default="", compare=False)
 
-    @computed_field  # type: ignore[prop-decorator]  # Pydantic computed field
-    @property
-    def name(self) -> str:
-        """Relative path under .worktrees/ (e.g., 'feature/auth')."""
-        parts = self.path.parts
-        try:
-            idx = parts.index(".worktrees")
-            return "/".join(parts[idx + 1 :])
-        except ValueError:
-            return self.path.name
-
-    @computed_field  # type: ignore[prop-decorator]  # Pydantic computed field
-    @property
-    def leaf(self) -> str:
-        """Last path component (e.g., 'auth' from '.worktrees/feature/auth')."""
-        return self.path.name
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are set through object.__setattr__.
+        if not self.name:
+            parts = self.path.parts
+            try:
+                idx = parts.index(".worktrees")
+                name = "/".join(parts[idx + 1 :])
+            except ValueError:
+                name = self.path.name
+            object.__setattr__(self, "name", name)
+        if not self.leaf:
+            object.__setattr__(self, "leaf", self.path.name)
 
 
 class AmbiguousWorktreeError(Exception):
@@ -109,11 +141,117 @@ def get_repo_root() -> Path:
     return git_common.resolve().parent
 
 
+class GitBatch:
+    """A long-lived ``git cat-file --batch`` process for object lookups.
+
+    Resolving a ref or reading a commit through the open pipe avoids a
+    git fork/exec per query, which matters for callers that ask the same
+    questions every few seconds (the live dashboard). Use as a context
+    manager; lookups return None if the process can't be started or has
+    exited.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> "GitBatch":
+        try:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_root), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._proc = None
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        """Stop the process (if any) and reap it."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                # Flushing into a pipe whose reader already exited.
+                pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def resolve(self, rev: str) -> str | None:
+        """Object id that ``rev`` points to, or None if it doesn't exist."""
+        found = self._query(rev)
+        return found[0] if found is not None else None
+
+    def commit_time(self, rev: str) -> int | None:
+        """Committer timestamp of commit ``rev``, or None if unavailable."""
+        found = self._query(rev)
+        if found is None or found[1] != "commit":
+            return None
+        return parse_committer_time(found[2])
+
+    def _query(self, rev: str) -> tuple[str, str, bytes] | None:
+        """Send one rev down the pipe; ``(oid, type, contents)`` or None."""
+        proc = self._proc
+        if proc is None or proc.stdin is None or proc.stdout is None or "\n" in rev:
+            return None
+        try:
+            proc.stdin.write(rev.encode() + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            # "<oid> <type> <size>\n<contents>\n" on success, "<rev> missing" otherwise.
+            parts = header.split()
+            if len(parts) != 3 or not parts[2].isdigit():
+                contents = None
+            else:
+                contents = proc.stdout.read(int(parts[2]) + 1)[:-1]
+        except OSError:
+            header = b""
+        if not header:
+            # The process died; reap it and stop using it.
+            self._close()
+            return None
+        if contents is None or not _is_sha(parts[0].decode()):
+            return None
+        return parts[0].decode(), parts[1].decode(), contents
+
+
+def parse_committer_time(contents: bytes) -> int | None:
+    """Extract the committer timestamp from a raw commit object.
+
+    Returns None if the object has no well-formed ``committer`` header.
+    """
+    headers, _, _ = contents.partition(b"\n\n")
+    for line in headers.split(b"\n"):
+        if line.startswith(b"committer "):
+            # "committer <name> <email> <timestamp> <tz>"
+            fields = line.rsplit(b" ", 2)
+            if len(fields) == 3 and fields[1].isdigit():
+                return int(fields[1])
+            return None
+    return None
+
+
+@lru_cache(maxsize=8)
 def get_default_branch(repo_root: Path) -> str:
     """Detect the default branch (main or master).
 
     Checks local refs for 'main' first, then 'master'.
     Falls back to 'main' if neither exists.
+
+    The answer is memoized per repo root for the life of the process;
+    long-running callers re-detect with ``get_default_branch.cache_clear()``.
     """
     for branch in ("main", "master"):
         result = subprocess.run(
@@ -126,13 +264,236 @@ def get_default_branch(repo_root: Path) -> str:
     return "main"
 
 
+# repo root -> (worktree fingerprint, worktrees) from the last list_worktrees.
+_WT_CACHE: dict[Path, tuple[list[int], list[WorktreeInfo]]] = {}
+
+
 def list_worktrees(repo_root: Path) -> list[WorktreeInfo]:
     """List all worktrees under .worktrees/.
 
-    Parses ``git worktree list --porcelain`` and returns only
-    worktrees located under the repo's ``.worktrees/`` directory,
-    excluding the main worktree.
+    Returns only worktrees located under the repo's ``.worktrees/``
+    directory, excluding the main worktree.
+
+    Worktrees are read directly from git's administrative files in
+    ``.git/worktrees/`` (see ``_list_worktrees_from_admin``). If the
+    repository layout isn't one we can read, falls back to parsing
+    ``git worktree list --porcelain``.
+
+    The result is kept in ``_WT_CACHE`` and returned again while the
+    stat fingerprint of ``.git/worktrees`` is unchanged.
+    """
+    fingerprint = _worktrees_fingerprint(repo_root)
+    cached = _WT_CACHE.get(repo_root)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        return list(cached[1])
+
+    worktrees = _list_worktrees_from_admin(repo_root)
+    if worktrees is None:
+        worktrees = _list_worktrees_porcelain(repo_root)
+    if fingerprint is not None:
+        _WT_CACHE[repo_root] = (fingerprint, worktrees)
+    return list(worktrees)
+
+
+def _list_worktrees_from_admin(repo_root: Path) -> list[WorktreeInfo] | None:
+    """Read linked worktrees from ``.git/worktrees/`` without running git.
+
+    Mirrors what ``git worktree list`` does: each admin entry's ``gitdir``
+    file points at the worktree, its ``HEAD`` names the branch (or a
+    detached commit), and the branch tip comes from the loose ref or
+    ``packed-refs``. Returns None when the layout is unexpected (no
+    ``.git`` directory, reftable refs, unparsable files) so the caller can
+    fall back to git.
+    """
+    common_dir = repo_root / ".git"
+    if not common_dir.is_dir() or (common_dir / "reftable").exists():
+        return None
+
+    worktrees: list[WorktreeInfo] = []
+    worktrees_dir = repo_root / ".worktrees"
+    packed: dict[str, str] | None = None
+    try:
+        entries = list(os.scandir(common_dir / "worktrees"))
+    except FileNotFoundError:
+        return worktrees
+    except OSError:
+        return None
+
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        admin = Path(entry.path)
+        try:
+            gitdir = (admin / "gitdir").read_text().strip()
+            head = (admin / "HEAD").read_text().strip()
+        except OSError:
+            # git skips entries with a missing or unreadable gitdir file.
+            continue
+        wt_path = Path(gitdir.removesuffix("/.git"))
+        if not wt_path.is_absolute():
+            wt_path = Path(os.path.realpath(admin / wt_path))
+
+        current = {"worktree": str(wt_path)}
+        if head.startswith("ref: "):
+            ref = head[len("ref: ") :]
+            commit = _read_loose_ref(common_dir, ref)
+            if commit is None:
+                if packed is None:
+                    packed = _read_packed_refs(common_dir)
+                commit = packed.get(ref, _NULL_SHA)
+            if not _is_sha(commit):
+                return None
+            current["branch"] = ref
+            current["HEAD"] = commit
+        elif _is_sha(head):
+            current["HEAD"] = head
+        else:
+            return None
+        _maybe_add_worktree(current, repo_root, worktrees_dir, worktrees)
+
+    # Match the path order ``git worktree list`` reports.
+    worktrees.sort(key=lambda wt: str(wt.path))
+    return worktrees
+
+
+_NULL_SHA = "0" * 40
+
+
+def _is_sha(text: str) -> bool:
+    """True if ``text`` looks like a full SHA-1 or SHA-256 object id."""
+    return len(text) in (40, 64) and all(c in "0123456789abcdef" for c in text)
+
+
+def _read_loose_ref(common_dir: Path, ref: str) -> str | None:
+    """Object id stored in a loose ref file, or None if there is none."""
+    try:
+        return (common_dir / ref).read_text().strip()
+    except OSError:
+        return None
+
+
+def _read_packed_refs(common_dir: Path) -> dict[str, str]:
+    """Map of ref name to object id from ``packed-refs`` (empty if absent)."""
+    refs: dict[str, str] = {}
+    try:
+        text = (common_dir / "packed-refs").read_text()
+    except OSError:
+        return refs
+    for line in text.splitlines():
+        if not line or line[0] in "#^":
+            continue
+        sha, _, name = line.partition(" ")
+        refs[name] = sha
+    return refs
+
+
+def list_worktrees_for_cwd() -> list[WorktreeInfo]:
+    """``list_worktrees(get_repo_root())``, cached per working directory.
+
+    Meant for shell completion, which runs on every Tab press. The cache
+    file lives in the runtime directory, is keyed on the current directory
+    and remembers its repo root, so a hit costs a few stats and a file
+    read instead of the ``git rev-parse`` call. It is validated with the
+    same fingerprint as the worktree list cache.
+
+    Raises:
+        GitError: If not inside a git repository.
+    """
+    cache_file = cache.runtime_dir() / f"{cache.cache_key(Path.cwd())}.completions"
+    entry = cache.load_entry(cache_file)
+    if entry is not None:
+        stamp, data = entry
+        if isinstance(data, dict) and isinstance(data.get("repo_root"), str):
+            fingerprint = _worktrees_fingerprint(Path(data["repo_root"]))
+            if fingerprint is not None and stamp == [data["repo_root"], *fingerprint]:
+                cached = _load_worktrees(data.get("worktrees"))
+                if cached is not None:
+                    return cached
+
+    repo_root = get_repo_root()
+    worktrees = list_worktrees(repo_root)
+    fingerprint = _worktrees_fingerprint(repo_root)
+    if fingerprint is not None:
+        cache.store(
+            cache_file,
+            [str(repo_root), *fingerprint],
+            {"repo_root": str(repo_root), "worktrees": _dump_worktrees(worktrees)},
+        )
+    return worktrees
+
+
+def _dump_worktrees(worktrees: list[WorktreeInfo]) -> list[dict[str, str]]:
+    """JSON-serializable form of a worktree list for the on-disk caches."""
+    return [{"path": str(wt.path), "branch": wt.branch, "commit": wt.commit} for wt in worktrees]
+
+
+def _load_worktrees(data: Any) -> list[WorktreeInfo] | None:
+    """Inverse of ``_dump_worktrees``; None if ``data`` isn't a valid list."""
+    if not isinstance(data, list):
+        return None
+    worktrees: list[WorktreeInfo] = []
+    for entry in data:
+        if not isinstance(entry, dict):
+            return None
+        path, branch, commit = entry.get("path"), entry.get("branch"), entry.get("commit")
+        if not (isinstance(path, str) and isinstance(branch, str) and isinstance(commit, str)):
+            return None
+        worktrees.append(WorktreeInfo(path=Path(path), branch=branch, commit=commit))
+    return worktrees
+
+
+def _worktrees_fingerprint(repo_root: Path) -> list[int] | None:
+    """Stat-only fingerprint of the repo's linked-worktree administrative data.
+
+    Covers ``.git/worktrees`` itself (worktrees added or removed) and, per
+    worktree, its admin directory, ``HEAD`` and ``HEAD`` reflog (moves,
+    checkouts and commits). Returns None if the layout isn't the standard
+    ``<repo_root>/.git`` directory, in which case nothing is cached. Repos
+    with reftable refs are not cacheable either: commits and checkouts
+    there don't touch the per-worktree ``HEAD`` files stat-ed here.
+    """
+    if (repo_root / ".git" / "reftable").exists():
+        return None
+    admin_dir = repo_root / ".git" / "worktrees"
+    try:
+        stamps = [admin_dir.stat().st_mtime_ns]
+        entries = _scan_worktrees_dir(admin_dir)
+    except FileNotFoundError:
+        # No linked worktrees yet — still cacheable as long as .git exists.
+        return [0] if (repo_root / ".git").is_dir() else None
+    except OSError:
+        return None
+    for name in sorted(entries):
+        stamps.append(entries[name].st_mtime_ns)
+        entry = os.path.join(admin_dir, name)
+        for path in (os.path.join(entry, "HEAD"), os.path.join(entry, "logs", "HEAD")):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+    return stamps
+
+
+def _scan_worktrees_dir(worktrees_dir: Path) -> dict[str, os.stat_result]:
+    """Stat every subdirectory of ``worktrees_dir`` in one directory scan.
+
+    ``os.scandir`` yields entries with their type already known, and
+    ``DirEntry.stat()`` reuses the entry's path, so this avoids building
+    and stat-ing a ``Path`` per entry.
+
+    Raises:
+        OSError: If ``worktrees_dir`` can't be read.
     """
+    with os.scandir(worktrees_dir) as it:
+        return {e.name: e.stat() for e in it if e.is_dir()}
+
+
+# ``git worktree list --porcelain`` attributes that _maybe_add_worktree reads.
+_PORCELAIN_KEYS = frozenset({"worktree", "HEAD", "branch"})
+
+
+def _list_worktrees_porcelain(repo_root: Path) -> list[WorktreeInfo]:
+    """Run and parse ``git worktree list --porcelain``."""
     result = subprocess.run(
         ["git", "worktree", "list", "--porcelain"],
         capture_output=True,
@@ -146,16 +507,15 @@ def list_worktrees(repo_root: Path) -> list[WorktreeInfo]:
     current: dict[str, str] = {}
     worktrees_dir = repo_root / ".worktrees"
 
-    for line in result.stdout.split("\n"):
-        if not line.strip():
+    for line in result.stdout.splitlines():
+        if not line:
             _maybe_add_worktree(current, repo_root, worktrees_dir, worktrees)
             current = {}
-        elif line.startswith("worktree "):
-            current["worktree"] = line[len("worktree ") :]
-        elif line.startswith("HEAD "):
-            current["HEAD"] = line[len("HEAD ") :]
-        elif line.startswith("branch "):
-            current["branch"] = line[len("branch ") :]
+            continue
+        # One partition per line instead of a startswith() per known key.
+        key, _, value = line.partition(" ")
+        if key in _PORCELAIN_KEYS:
+            current[key] = value
 
     # Handle final entry (output may not end with a blank line)
     _maybe_add_worktree(current, repo_root, worktrees_dir, worktrees)
@@ -180,42 +540,197 @@ def _maybe_add_worktree(
 
     # Only include worktrees under .worktrees/
     try:
-        wt_path.relative_to(worktrees_dir)
+        rel = wt_path.relative_to(worktrees_dir)
     except ValueError:
         return
 
     branch = current.get("branch", "").replace("refs/heads/", "")
     commit = current.get("HEAD", "")
-    worktrees.append(WorktreeInfo(path=wt_path, branch=branch, commit=commit))
+    worktrees.append(
+        WorktreeInfo(
+            path=wt_path, branch=branch, commit=commit, name=rel.as_posix(), leaf=wt_path.name
+        )
+    )
+
+
+class _TrieNode:
+    """A node in a character trie mapping keys to worktrees."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.items: list[tuple[int, WorktreeInfo]] = []
+
+
+class WorktreeIndex:
+    """Lookup structures over worktree names and leaves.
+
+    Built once per worktree list. Exact name and leaf lookups are dict
+    hits, prefix lookups walk a character trie in O(len(query)), and
+    substring lookups are a single ``str.find`` pass over all keys joined
+    together — none of them scan worktrees one by one. Used by name
+    resolution and by shell completion, which runs on every Tab press.
+
+    Only the dicts are built up front, in one pass. The trie and joined
+    keys are built on first use, so a query settled by an exact name or
+    leaf match never pays for them.
+    """
+
+    def __init__(self, worktrees: list[WorktreeInfo]) -> None:
+        self.worktrees = worktrees
+        self._by_name: dict[str, WorktreeInfo] = {}
+        self._by_leaf: dict[str, list[WorktreeInfo]] = {}
+        for wt in worktrees:
+            self._by_name.setdefault(wt.name, wt)
+            self._by_leaf.setdefault(wt.leaf, []).append(wt)
+
+    @cached_property
+    def _leaves(self) -> _TrieNode:
+        """Character trie over leaves, for prefix lookups."""
+        root = _TrieNode()
+        for pos, wt in enumerate(self.worktrees):
+            _trie_insert(root, wt.leaf, pos, wt)
+        return root
+
+    @cached_property
+    def _joined_names(self) -> "_JoinedKeys":
+        """Joined full relative paths, for substring lookups."""
+        return _JoinedKeys([wt.name for wt in self.worktrees])
+
+    @cached_property
+    def _joined_leaves(self) -> "_JoinedKeys":
+        """Joined leaves, for substring lookups."""
+        return _JoinedKeys([wt.leaf for wt in self.worktrees])
+
+    def by_name(self, name: str) -> WorktreeInfo | None:
+        """Worktree whose full relative path is exactly ``name``."""
+        return self._by_name.get(name)
+
+    def by_leaf(self, leaf: str) -> list[WorktreeInfo]:
+        """All worktrees whose leaf is exactly ``leaf``."""
+        return list(self._by_leaf.get(leaf, ()))
 
+    def leaf_prefix(self, prefix: str) -> list[WorktreeInfo]:
+        """All worktrees whose leaf starts with ``prefix``, in list order."""
+        node = _trie_find(self._leaves, prefix)
+        if node is None:
+            return []
+        found: list[tuple[int, WorktreeInfo]] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.extend(current.items)
+            stack.extend(current.children.values())
+        found.sort(key=lambda item: item[0])
+        return [wt for _, wt in found]
 
-def resolve_worktree(query: str, worktrees: list[WorktreeInfo]) -> WorktreeInfo:
+    def name_substring(self, query: str) -> list[WorktreeInfo]:
+        """All worktrees whose full relative path contains ``query``, in list order."""
+        return [self.worktrees[i] for i in self._joined_names.containing(query)]
+
+    def leaf_substring(self, query: str) -> list[WorktreeInfo]:
+        """All worktrees whose leaf contains ``query``, in list order."""
+        return [self.worktrees[i] for i in self._joined_leaves.containing(query)]
+
+
+class _JoinedKeys:
+    """Keys concatenated with NUL separators for one-pass substring search."""
+
+    __slots__ = ("text", "starts")
+
+    def __init__(self, keys: list[str]) -> None:
+        self.text = "\0".join(keys)
+        self.starts: list[int] = []
+        offset = 0
+        for key in keys:
+            self.starts.append(offset)
+            offset += len(key) + 1
+
+    def containing(self, query: str) -> list[int]:
+        """Indices of the keys that contain ``query``."""
+        if "\0" in query or not self.starts:
+            return []
+        hits: list[int] = []
+        pos = 0
+        while (found := self.text.find(query, pos)) != -1:
+            i = bisect_right(self.starts, found) - 1
+            hits.append(i)
+            if i + 1 == len(self.starts):
+                break
+            # Resume at the next key so each key is reported at most once.
+            pos = self.starts[i + 1]
+        return hits
+
+
+def _trie_insert(root: _TrieNode, key: str, pos: int, wt: WorktreeInfo) -> None:
+    """Insert ``wt`` under ``key``."""
+    node = root
+    for ch in key:
+        child = node.children.get(ch)
+        if child is None:
+            child = node.children[ch] = _TrieNode()
+        node = child
+    node.items.append((pos, wt))
+
+
+def _trie_find(root: _TrieNode, key: str) -> _TrieNode | None:
+    """Walk to the node for ``key``, or None if no key has that prefix."""
+    node = root
+    for ch in key:
+        child = node.children.get(ch)
+        if child is None:
+            return None
+        node = child
+    return node
+
+
+def build_worktree_index(worktrees: list[WorktreeInfo]) -> WorktreeIndex:
+    """Build a lookup index over ``worktrees``."""
+    return WorktreeIndex(worktrees)
+
+
+def resolve_worktree(
+    query: str,
+    worktrees: list[WorktreeInfo],
+    index: WorktreeIndex | None = None,
+) -> WorktreeInfo:
     """Resolve a user query to a single worktree.
 
     Resolution order:
       1. Exact match on full relative path (e.g., 'feature/auth')
       2. Exact match on leaf name (e.g., 'auth')
-      3. Substring match on relative path (e.g., 'au')
+      3. Substring match on relative path (e.g., 'pars'), only for queries
+         of at least ``MIN_SUBSTRING_QUERY_LENGTH`` characters
       4. Error on ambiguity or no match
 
+    All steps are lookups on ``index``, which is built from ``worktrees``
+    if not given; pass a prebuilt index to share it across calls.
+
     Raises:
         AmbiguousWorktreeError: If multiple worktrees match.
         WorktreeNotFoundError: If no worktree matches.
     """
+    if index is None:
+        index = build_worktree_index(worktrees)
+
     # 1. Exact path match
-    for wt in worktrees:
-        if wt.name == query:
-            return wt
+    exact = index.by_name(query)
+    if exact is not None:
+        return exact
 
     # 2. Leaf name match
-    leaf_matches = [wt for wt in worktrees if wt.leaf == query]
+    leaf_matches = index.by_leaf(query)
     if len(leaf_matches) == 1:
         return leaf_matches[0]
     if len(leaf_matches) > 1:
         raise AmbiguousWorktreeError(query, leaf_matches)
 
-    # 3. Substring match
-    sub_matches = [wt for wt in worktrees if query in wt.name]
+    # 3. Substring match — too-short queries match almost everything, so
+    # they skip straight to "not found" instead of an ambiguity error.
+    if len(query) < MIN_SUBSTRING_QUERY_LENGTH:
+        raise WorktreeNotFoundError(query, worktrees)
+    sub_matches = index.name_substring(query)
     if len(sub_matches) == 1:
         return sub_matches[0]
     if len(sub_matches) > 1:
@@ -225,71 +740,298 @@ def resolve_worktree(query: str, worktrees: list[WorktreeInfo]) -> WorktreeInfo:
     raise WorktreeNotFoundError(query, worktrees)
 
 
-def check_leaf_collision(wt: WorktreeInfo, worktrees: list[WorktreeInfo]) -> list[WorktreeInfo]:
+def check_leaf_collision(
+    wt: WorktreeInfo,
+    worktrees: list[WorktreeInfo],
+    index: WorktreeIndex | None = None,
+) -> list[WorktreeInfo]:
     """Check if other worktrees share the same leaf name.
 
     Returns all worktrees with the same leaf (including ``wt`` itself).
-    A return list of length > 1 indicates a collision.
+    A return list of length > 1 indicates a collision. Uses ``index``
+    for an O(1) lookup when given.
     """
+    if index is not None:
+        return index.by_leaf(wt.leaf)
     return [w for w in worktrees if w.leaf == wt.leaf]
 
 
-def get_divergence(repo_root: Path, branch: str, default_branch: str) -> Divergence:
+# (branch commit, default branch commit) -> divergence. Both sides are
+# commit ids, which never change, so entries never go stale.
+_DIV_CACHE: dict[tuple[str, str], Divergence] = {}
+
+
+def get_divergence(
+    repo_root: Path,
+    branch: str,
+    default_branch: str,
+    *,
+    branch_commit: str | None = None,
+    default_commit: str | None = None,
+) -> Divergence:
     """Get commit divergence between a branch and the default branch.
 
     Uses ``git rev-list --left-right --count default...branch`` which
     compares via the merge base. Left count = commits on default only
     (behind), right count = commits on branch only (ahead).
+
+    When both tip commits are given, they are compared directly and the
+    result is cached in ``_DIV_CACHE``, so repeated calls for unchanged
+    tips don't run git.
     """
+    key = None
+    if branch_commit is not None and default_commit is not None:
+        key = (branch_commit, default_commit)
+        cached = _DIV_CACHE.get(key)
+        if cached is not None:
+            return cached
+        branch, default_branch = branch_commit, default_commit
+
     result = subprocess.run(
         ["git", "rev-list", "--left-right", "--count", f"{default_branch}...{branch}"],
         capture_output=True,
-        text=True,
         cwd=repo_root,
     )
     if result.returncode != 0:
         return Divergence(ahead=0, behind=0)
+    divergence = _parse_left_right(result.stdout)
+    if key is not None:
+        _DIV_CACHE[key] = divergence
+    return divergence
+
+
+def _parse_left_right(output: bytes) -> Divergence:
+    """Parse ``rev-list --left-right --count default...branch`` output.
 
-    parts = result.stdout.strip().split("\t")
-    if len(parts) != 2:
+    The output is two ASCII counts, so it is parsed as bytes, undecoded.
+    """
+    parts = output.strip().split(b"\t")
+    if len(parts) != 2 or not (parts[0].isdigit() and parts[1].isdigit()):
         return Divergence(ahead=0, behind=0)
 
     behind, ahead = int(parts[0]), int(parts[1])
     return Divergence(ahead=ahead, behind=behind)
 
 
-def get_modified_count(worktree_path: Path) -> int:
-    """Count modified/untracked files in a worktree."""
+def get_all_divergences(
+    repo_root: Path,
+    branches: Iterable[str],
+    default_branch: str,
+    *,
+    commits: Mapping[str, str] | None = None,
+    default_commit: str | None = None,
+) -> dict[str, Divergence]:
+    """Get the divergence of several branches from the default branch at once.
+
+    Runs a single ``git for-each-ref`` with ``%(ahead-behind:...)`` (git
+    2.41+), which counts every branch in one history walk. If that fails
+    (older git), falls back to one ``get_divergence``-style ``rev-list``
+    per branch, started concurrently.
+
+    With ``default_commit`` (the default branch tip), results are cached
+    in ``_DIV_CACHE`` by commit pair, and branches whose current commit
+    is known from ``commits`` (branch -> commit) are answered from that
+    cache without running git.
+
+    Returns a mapping with an entry for every requested branch; branches
+    that can't be compared get zero divergence, like ``get_divergence``.
+    """
+    wanted = list(dict.fromkeys(branches))
+    known = commits or {}
+    divergences: dict[str, Divergence] = {}
+    if default_commit is not None:
+        for b in wanted:
+            commit = known.get(b)
+            cached = _DIV_CACHE.get((commit, default_commit)) if commit else None
+            if cached is not None:
+                divergences[b] = cached
+    pending = [b for b in wanted if b not in divergences]
+    if not pending:
+        return divergences
+
+    base = default_commit or f"refs/heads/{default_branch}"
     result = subprocess.run(
-        ["git", "-C", str(worktree_path), "status", "--porcelain"],
+        [
+            "git",
+            "for-each-ref",
+            f"--format=%(refname)\t%(objectname)\t%(ahead-behind:{base})",
+            *(f"refs/heads/{b}" for b in pending),
+        ],
         capture_output=True,
         text=True,
+        cwd=repo_root,
     )
-    if result.returncode != 0:
-        return 0
-    return sum(1 for line in result.stdout.split("\n") if line.strip())
+    found: Mapping[str, tuple[str | None, Divergence]]
+    if result.returncode == 0:
+        found = parse_ahead_behind(result.stdout)
+    else:
+        found = _rev_list_divergences(repo_root, {b: known.get(b, b) for b in pending}, base)
+    for b in pending:
+        commit, divergence = found.get(b, (None, Divergence(ahead=0, behind=0)))
+        divergences[b] = divergence
+        if commit is not None and default_commit is not None:
+            _DIV_CACHE[(commit, default_commit)] = divergence
+    return divergences
+
+
+def parse_ahead_behind(output: str) -> dict[str, tuple[str, Divergence]]:
+    """Parse ``for-each-ref`` output in the ``get_all_divergences`` format.
+
+    Each line is ``<refname> TAB <objectname> TAB <ahead> <behind>``. Keys
+    are branch names (``refs/heads/`` stripped), mapped to the tip commit
+    the counts were computed for. Refs outside ``refs/heads/`` and
+    malformed lines are skipped.
+    """
+    divergences: dict[str, tuple[str, Divergence]] = {}
+    for line in output.splitlines():
+        refname, _, rest = line.partition("\t")
+        commit, _, counts = rest.partition("\t")
+        branch = refname.removeprefix("refs/heads/")
+        parts = counts.split()
+        if branch == refname or len(parts) != 2 or not all(p.isdigit() for p in parts):
+            continue
+        divergences[branch] = (commit, Divergence(ahead=int(parts[0]), behind=int(parts[1])))
+    return divergences
+
 
+def _rev_list_divergences(
+    repo_root: Path, revs: dict[str, str], base: str
+) -> dict[str, tuple[str | None, Divergence]]:
+    """Run one ``rev-list --left-right --count`` per branch, concurrently.
 
-def get_last_commit_time(worktree_path: Path) -> str:
-    """Get relative time since the last commit (e.g., '2 hours ago')."""
+    ``revs`` maps each branch to the revision to compare (its name, or its
+    commit when known). Results carry that commit only when one was given,
+    since that's the only case where the counts belong to a known commit.
+    At most ``MAX_PROBE_WORKERS`` git processes run at a time.
+    """
+    items = list(revs.items())
+    divergences: dict[str, tuple[str | None, Divergence]] = {}
+    for start in range(0, len(items), MAX_PROBE_WORKERS):
+        procs = [
+            (
+                branch,
+                rev,
+                subprocess.Popen(
+                    ["git", "rev-list", "--left-right", "--count", f"{base}...{rev}"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=repo_root,
+                ),
+            )
+            for branch, rev in items[start : start + MAX_PROBE_WORKERS]
+        ]
+        for branch, rev, proc in procs:
+            stdout, _ = proc.communicate()
+            if proc.returncode == 0:
+                divergences[branch] = (rev if _is_sha(rev) else None, _parse_left_right(stdout))
+    return divergences
+
+
+def get_worktree_stats(worktree_path: Path) -> WorktreeStats:
+    """Get the modified-file count and HEAD commit of a worktree in one call.
+
+    Runs ``git status --porcelain=v2 --branch -z``: the ``# branch.oid``
+    header carries the HEAD commit and every other record is one changed
+    or untracked path. Untracked directories are reported as a single
+    entry (``--untracked-files=normal``) regardless of the user's
+    ``status.showUntrackedFiles``, since listing every file inside them
+    is the slow path in large repos. ``--no-ahead-behind`` stops git from
+    walking history for the unused ``# branch.ab`` upstream counts.
+    """
     result = subprocess.run(
-        ["git", "-C", str(worktree_path), "log", "-1", "--format=%cr"],
+        [
+            "git",
+            "-C",
+            str(worktree_path),
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "--no-ahead-behind",
+            "-z",
+            "--untracked-files=normal",
+        ],
         capture_output=True,
-        text=True,
     )
     if result.returncode != 0:
-        return "unknown"
-    return result.stdout.strip()
+        return WorktreeStats(modified=0, head=None)
+    return parse_status_v2(result.stdout)
+
+
+def parse_status_v2(output: bytes) -> WorktreeStats:
+    """Parse ``git status --porcelain=v2 --branch -z`` output.
+
+    Records are NUL-terminated and left undecoded. Rename and copy
+    records (type ``2``) are followed by an extra record holding the
+    original path, which is skipped rather than counted.
+    """
+    modified = 0
+    head: str | None = None
+    records = iter(output.split(b"\0"))
+    for record in records:
+        if record.startswith(b"# branch.oid "):
+            oid = record[len(b"# branch.oid ") :].decode()
+            head = None if oid == "(initial)" else oid
+        elif record and not record.startswith(b"#"):
+            modified += 1
+            if record.startswith(b"2 "):
+                next(records, None)
+    return WorktreeStats(modified=modified, head=head)
 
 
-def get_last_commit_timestamp(worktree_path: Path) -> int:
-    """Get Unix timestamp of the last commit (for sorting)."""
+def get_commit_time(worktree_path: Path, commit: str | None = None) -> int:
+    """Get the committer Unix timestamp of a commit.
+
+    Reads ``commit`` if given, else the worktree's HEAD. Returns 0 if the
+    worktree has no commits or git fails. Display goes through
+    ``format_relative_time`` so every row is formatted the same way.
+    """
     result = subprocess.run(
-        ["git", "-C", str(worktree_path), "log", "-1", "--format=%ct"],
+        ["git", "-C", str(worktree_path), "log", "-1", "--format=%ct", commit or "HEAD"],
         capture_output=True,
-        text=True,
     )
-    if result.returncode != 0:
+    timestamp = result.stdout.strip()
+    if result.returncode != 0 or not timestamp.isdigit():
         return 0
-    text = result.stdout.strip()
-    return int(text) if text else 0
+    return int(timestamp)
+
+
+def format_relative_time(timestamp: int, now: float | None = None) -> str:
+    """Format a Unix timestamp relative to now, matching git's ``%cr``.
+
+    Mirrors the bucketing of git's ``show_date_relative``, so timestamps
+    render like an untranslated ``git log --format=%cr``.
+    """
+    current = int(time.time() if now is None else now)
+    if current < timestamp:
+        return "in the future"
+    diff = current - timestamp
+    if diff < 90:
+        return _plural(diff, "second") + " ago"
+    # Minutes
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return _plural(diff, "minute") + " ago"
+    # Hours
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return _plural(diff, "hour") + " ago"
+    # Days from here on
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return _plural(diff, "day") + " ago"
+    if diff < 70:
+        return _plural((diff + 3) // 7, "week") + " ago"
+    if diff < 365:
+        return _plural((diff + 15) // 30, "month") + " ago"
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{_plural(years, 'year')}, {_plural(months, 'month')} ago"
+        return _plural(years, "year") + " ago"
+    return _plural((diff + 183) // 365, "year") + " ago"
+
+
+def _plural(count: int, unit: str) -> str:
+    """Render '1 hour' / '2 hours'."""
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
@@ -2,6 +2,14 @@
 
 import os
 import subprocess
+import time
+from collections.abc import Iterable
+
+# How long a list_windows() result may be reused within one process.
+LIST_WINDOWS_TTL_SECONDS = 1.0
+
+# session name -> (monotonic time of query, window names)
+_windows_cache: dict[str, tuple[float, list[str]]] = {}
 
 
 class TmuxError(Exception):
@@ -50,26 +58,86 @@ def create_session(session_name: str, window_name: str, start_dir: str) -> None:
         ],
         check=True,
     )
+    _invalidate_windows(session_name)
 
 
 def list_windows(session_name: str) -> list[str]:
     """List all window names in a tmux session.
 
+    Results are reused for ``LIST_WINDOWS_TTL_SECONDS`` so the several
+    lookups made by a single command share one tmux query. Functions in
+    this module that create or kill windows invalidate the cache.
+
     Returns an empty list if the session doesn't exist or tmux
     is not available.
     """
-    if not session_exists(session_name):
+    now = time.monotonic()
+    cached = _windows_cache.get(session_name)
+    if cached is not None and now - cached[0] < LIST_WINDOWS_TTL_SECONDS:
+        return list(cached[1])
+    windows = _query_windows(session_name)
+    _windows_cache[session_name] = (now, windows)
+    return list(windows)
+
+
+def _invalidate_windows(session_name: str) -> None:
+    """Drop the cached ``list_windows`` result for a session."""
+    _windows_cache.pop(session_name, None)
+
+
+def _query_windows(session_name: str) -> list[str]:
+    """Ask tmux for the window names in a session.
+
+    ``list-windows`` exits non-zero when the session (or the tmux server)
+    doesn't exist, so no separate ``has-session`` probe is needed.
+    """
+    try:
+        result = subprocess.run(
+            ["tmux", "list-windows", "-t", session_name, "-F", "#{window_name}"],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
         return []
-    result = subprocess.run(
-        ["tmux", "list-windows", "-t", session_name, "-F", "#{window_name}"],
-        capture_output=True,
-        text=True,
-    )
     if result.returncode != 0:
         return []
     return [w.strip() for w in result.stdout.strip().split("\n") if w.strip()]
 
 
+def batch_tmux_state(session_name: str) -> set[str]:
+    """Snapshot the windows of a tmux session with a single tmux call.
+
+    Runs one ``tmux list-panes -a`` across the whole server and keeps the
+    panes belonging to ``session_name``, so callers that refresh often
+    (e.g., the live dashboard) avoid the ``has-session`` + ``list-windows``
+    round trip.
+
+    Returns the names of the session's windows. Empty if the session
+    doesn't exist or tmux is not available.
+    """
+    try:
+        result = subprocess.run(
+            ["tmux", "list-panes", "-a", "-F", "#{session_name}\t#{window_name}"],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return set()
+    if result.returncode != 0:
+        return set()
+    return _parse_panes(result.stdout, session_name)
+
+
+def _parse_panes(output: str, session_name: str) -> set[str]:
+    """Window names of ``session_name`` in ``session<TAB>window`` pane lines."""
+    windows: set[str] = set()
+    for line in output.splitlines():
+        session, sep, window_name = line.partition("\t")
+        if sep and session == session_name:
+            windows.add(window_name)
+    return windows
+
+
 def window_exists(session_name: str, window_name: str) -> bool:
     """Check if a named window exists in a tmux session."""
     return window_name in list_windows(session_name)
@@ -90,6 +158,7 @@ def create_window(session_name: str, window_name: str, start_dir: str) -> None:
         ],
         check=True,
     )
+    _invalidate_windows(session_name)
 
 
 def switch_to_window(session_name: str, window_name: str) -> None:
@@ -106,3 +175,43 @@ def kill_window(session_name: str, window_name: str) -> None:
         ["tmux", "kill-window", "-t", f"{session_name}:{window_name}"],
         capture_output=True,
     )
+    _invalidate_windows(session_name)
+
+
+def kill_windows_batch(session_name: str, window_names: Iterable[str]) -> list[str]:
+    """Kill several windows in a tmux session with a single tmux invocation.
+
+    Chains ``kill-window`` commands with tmux's ``;`` separator so K windows
+    cost one subprocess instead of K. tmux abandons the chain at the first
+    command that fails, so on failure the windows are killed one at a time
+    instead.
+
+    Returns the names of the requested windows that are gone afterwards.
+    """
+    names = list(window_names)
+    if not names:
+        return []
+    result = subprocess.run(["tmux", *_kill_windows_args(session_name, names)], capture_output=True)
+    _invalidate_windows(session_name)
+    if result.returncode == 0:
+        return names
+
+    for window_name in names:
+        kill_window(session_name, window_name)
+    return _gone_windows(names, list_windows(session_name))
+
+
+def _kill_windows_args(session_name: str, window_names: list[str]) -> list[str]:
+    """tmux arguments chaining one ``kill-window`` per name with ``;``."""
+    args: list[str] = []
+    for window_name in window_names:
+        if args:
+            args.append(";")
+        args += ["kill-window", "-t", f"{session_name}:{window_name}"]
+    return args
+
+
+def _gone_windows(requested: list[str], remaining: Iterable[str]) -> list[str]:
+    """The ``requested`` window names that are not among ``remaining``."""
+    still_open = set(remaining)
+    return [name for name in requested if name not in still_open]